@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import logging
+import os
 import re
 import shutil
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple, Any
+from typing import Optional, List, Dict, NamedTuple, Tuple, Any
 from urllib.parse import unquote
 
 try:
@@ -21,7 +24,37 @@ try:
 except ImportError:  # pragma: no cover - handled in main
     frontmatter = None
 
-from dataclasses import dataclass, field
+try:
+    import orjson  # optional: much faster JSON report serialization
+except ImportError:  # pragma: no cover
+    orjson = None
+
+if frontmatter is not None:
+    import yaml
+    from frontmatter.default_handlers import YAMLHandler
+
+    # libyaml's C loader is several times faster than the pure-Python
+    # SafeLoader that python-frontmatter defaults to; fall back gracefully
+    # when PyYAML was built without the C extension.
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    _YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+    class _CSafeYAMLHandler(YAMLHandler):
+        """YAMLHandler that parses and dumps with the fastest safe classes."""
+
+        def load(self, fm: str, **kwargs: Any) -> Any:
+            kwargs.setdefault("Loader", _YAML_LOADER)
+            return yaml.load(fm, **kwargs)
+
+        def export(self, metadata: Dict[str, Any], **kwargs: Any) -> str:
+            kwargs.setdefault("Dumper", _YAML_DUMPER)
+            return super().export(metadata, **kwargs)
+
+    _FRONTMATTER_HANDLER = _CSafeYAMLHandler()
+else:  # pragma: no cover
+    _FRONTMATTER_HANDLER = None
+
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 
 
@@ -48,9 +81,12 @@ class CollisionStrategy(Enum):
 
 
 # Data models
-@dataclass
-class WikiLink:
-    """Represents a wikilink [[target|alias]]."""
+class WikiLink(NamedTuple):
+    """Represents a wikilink [[target|alias]].
+
+    A NamedTuple rather than a dataclass: no per-instance __dict__, and
+    hashable so callers can dedup links with a set.
+    """
     target: str
     alias: Optional[str] = None
 
@@ -64,6 +100,22 @@ class AttachmentReference:
     exists: bool = False
 
 
+@dataclass(slots=True)
+class NoteReport:
+    """Per-note row of the migration report.
+
+    Slotted so large migrations keep one compact instance per note
+    instead of a six-key dict; converted back to plain dicts only when
+    the report is serialized.
+    """
+    note: str
+    destinations: List[str]
+    attachments: List[str]
+    missing_attachments: List[str] = field(default_factory=list)
+    attachments_count: int = 0
+    missing_attachments_count: int = 0
+
+
 @dataclass
 class MigrationConfig:
     """Configuration for migration process."""
@@ -136,16 +188,46 @@ def setup_logging(verbose: int = 0, quiet: bool = False, log_file: Optional[Path
         )
         fh.setFormatter(formatter)
         logging.getLogger().addHandler(fh)
-        logger.info(f"Logging to file: {log_file}")
+        logger.info("Logging to file: %s", log_file)
 
 
-# Match image or link markdown with optional title.
+# Category separators: "/" with optional surrounding whitespace.
+CATEGORY_SPLIT_RE = re.compile(r"\s*/\s*")
+# Match image or link markdown with optional title. Link text excludes '['
+# and bare targets exclude '(' so a failed match attempt dies at the next
+# opening delimiter instead of rescanning to the end of the note -- keeps
+# matching linear on adversarial input full of unclosed brackets.
 LINK_RE = re.compile(
-    r'!?\[[^\]]*]\((?P<target><[^>]+>|[^)\s]+)(?:\s+"[^"]*")?\)'
+    r'!?\[[^\]\[]*]\((?P<target><[^>]+>|[^()\s]+)(?:\s+"[^"]*")?\)'
 )
-FENCE_RE = re.compile(r"^\s*(`{3,}|~{3,})(.*)$")
 # Match wikilinks [[target]] or [[target|alias]]
-WIKILINK_RE = re.compile(r'\[\[([^\]|]+)(?:\|([^\]]+))?\]\]')
+WIKILINK_RE = re.compile(r'\[\[([^\][|]+)(?:\|([^\][]+))?\]\]')
+# Match markdown links that point to .md files (for to-wikilink conversion)
+MD_LINK_RE = re.compile(r'\[([^\]\[]+)\]\(([^()]+\.md)\)')
+# Single-pass scanner: fence lines, markdown links, wikilinks and .md links
+# (the last only relevant in TO_WIKILINK mode) in one alternation so each
+# note is walked exactly once instead of per-line, per-pattern.
+COMBINED_RE = re.compile(
+    r'(?P<fence>^[ \t]*(?P<fchars>`{3,}|~{3,})[^\n]*)'
+    r'|(?P<link>!?\[[^\]\[]*]\((?P<target><[^>]+>|[^()\s]+)(?:[ \t]+"[^"]*")?\))'
+    r'|(?P<wiki>\[\[[^\][|\n]+(?:\|[^\][\n]+)?\]\])'
+    r'|(?P<mdlink>\[[^\]\[\n]+\]\([^()\n]+\.md\))',
+    re.MULTILINE,
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cat_to_path(raw: str, base_str: str) -> Optional[Path]:
+    """Split one category string into a destination Path (memoized).
+
+    Vaults usually reuse a handful of category strings across many notes,
+    so caching turns the repeated split/strip work into a dict lookup.
+    Returns None for strings with no usable parts.
+    """
+    parts = [p.strip() for p in CATEGORY_SPLIT_RE.split(raw) if p.strip()]
+    if not parts:
+        return None
+    return Path(base_str).joinpath(*parts)
 
 
 def normalize_categories(raw_categories: Optional[str | List[str]], base_dir: Path) -> List[Path]:
@@ -173,17 +255,24 @@ def normalize_categories(raw_categories: Optional[str | List[str]], base_dir: Pa
     if isinstance(raw_categories, str):
         raw_categories = [raw_categories]
 
+    base_str = str(base_dir)
     paths = []
     for raw in raw_categories:
         if not raw:
             continue
-        parts = [p.strip() for p in re.split(r"\s*/\s*", raw) if p.strip()]
-        if not parts:
-            continue
-        paths.append(base_dir.joinpath(*parts))
+        path = _cat_to_path(raw, base_str)
+        if path is not None:
+            paths.append(path)
     return paths or [base_dir]
 
 
+def _is_files_target(target: str) -> bool:
+    """Cheap pre-check so non-Files/ link targets skip split_files_target."""
+    t = target[1:-1] if target[:1] == "<" else target
+    return t.startswith("Files/") or t.startswith("./Files/")
+
+
+@functools.lru_cache(maxsize=4096)
 def split_files_target(target: str) -> Optional[Tuple[bool, str, str]]:
     """Parse a markdown link target to extract Files/ attachment reference.
 
@@ -203,6 +292,10 @@ def split_files_target(target: str) -> Optional[Tuple[bool, str, str]]:
         >>> split_files_target("<Files/test%20file.png>")
         (True, "test%20file.png", "test file.png")
     """
+    # Reject URL schemes outright; they can never be Files/ references and
+    # this skips the slicing below for the most common non-attachment links.
+    if target.startswith(("http://", "https://", "mailto:", "#")):
+        return None
     wrapped = target.startswith("<") and target.endswith(">")
     raw = target[1:-1] if wrapped else target
     if raw.startswith("./"):
@@ -210,11 +303,58 @@ def split_files_target(target: str) -> Optional[Tuple[bool, str, str]]:
     if not raw.startswith("Files/"):
         return None
     rel_raw = raw[len("Files/"):]
-    rel_decoded = unquote(rel_raw)
+    # unquote allocates even when there is nothing to decode; skip it for
+    # the common escape-free filename.
+    rel_decoded = unquote(rel_raw) if "%" in rel_raw else rel_raw
     return wrapped, rel_raw, rel_decoded
 
 
-def resolve_source_path(rel_raw: str, rel_decoded: str, source_dir: Path) -> Optional[Path]:
+def iter_md_files(source_dir: Path):
+    """Yield os.DirEntry objects for markdown files in source_dir.
+
+    Uses os.scandir so entries carry cached file-type information instead of
+    materializing a Path plus an extra stat per directory entry.
+
+    Args:
+        source_dir: Directory to scan (not recursive)
+
+    Yields:
+        os.DirEntry objects whose names end in .md (case-insensitive)
+    """
+    with os.scandir(source_dir) as it:
+        for entry in it:
+            # Tuple endswith covers the case variants without allocating a
+            # lowercased copy of every directory entry name.
+            if entry.name.endswith((".md", ".MD", ".Md", ".mD")) and entry.is_file():
+                yield entry
+
+
+def build_files_index(source_dir: Path) -> frozenset:
+    """Build an index of attachment paths available under source_dir/Files.
+
+    Walks the Files/ directory once so attachment existence checks become
+    set lookups instead of per-attachment stat syscalls.
+
+    Args:
+        source_dir: Source directory containing Files/ folder
+
+    Returns:
+        Frozen set of POSIX-style paths relative to Files/ (empty if Files/
+        does not exist)
+    """
+    files_dir = source_dir / "Files"
+    names = []
+    for root, _dirs, files in os.walk(files_dir):
+        rel_root = Path(root).relative_to(files_dir).as_posix()
+        if rel_root == ".":
+            names.extend(files)
+        else:
+            names.extend(f"{rel_root}/{name}" for name in files)
+    return frozenset(names)
+
+
+def resolve_source_path(rel_raw: str, rel_decoded: str, source_dir: Path,
+                        files_index: Optional[frozenset] = None) -> Optional[Path]:
     """Resolve attachment path to actual file on disk.
 
     Tries decoded filename first (most common), then falls back to raw URL-encoded
@@ -224,6 +364,8 @@ def resolve_source_path(rel_raw: str, rel_decoded: str, source_dir: Path) -> Opt
         rel_raw: URL-encoded relative path (e.g., "test%20file.png")
         rel_decoded: Decoded relative path (e.g., "test file.png")
         source_dir: Source directory containing Files/ folder
+        files_index: Optional pre-built index from build_files_index; when
+            given, existence is checked via set membership instead of stat
 
     Returns:
         Path to existing file, or None if file not found
@@ -233,6 +375,13 @@ def resolve_source_path(rel_raw: str, rel_decoded: str, source_dir: Path) -> Opt
         Path("/export/Files/test file.png")
     """
     # Prefer decoded filenames (typical on disk), but fall back to raw if needed.
+    if files_index is not None:
+        if rel_decoded in files_index:
+            return source_dir / "Files" / rel_decoded
+        if rel_raw in files_index:
+            return source_dir / "Files" / rel_raw
+        return None
+
     decoded_path = source_dir / "Files" / rel_decoded
     if decoded_path.exists():
         return decoded_path
@@ -242,6 +391,10 @@ def resolve_source_path(rel_raw: str, rel_decoded: str, source_dir: Path) -> Opt
     return None
 
 
+# Characters that force a link target to be wrapped in angle brackets.
+_LINK_SPECIAL = frozenset(" ()")
+
+
 def safe_link_target(path_str: str) -> str:
     """Wrap link target in angle brackets if it contains special characters.
 
@@ -261,8 +414,9 @@ def safe_link_target(path_str: str) -> str:
         >>> safe_link_target("file(1).png")
         "<file(1).png>"
     """
-    # Wrap in angle brackets when spaces are present to avoid Markdown parsing issues.
-    if " " in path_str or "(" in path_str or ")" in path_str:
+    # Wrap in angle brackets when spaces are present to avoid Markdown parsing
+    # issues. isdisjoint scans the string once in C instead of three times.
+    if not _LINK_SPECIAL.isdisjoint(path_str):
         return f"<{path_str}>"
     return path_str
 
@@ -288,15 +442,21 @@ def rewrite_links_in_text(text: str, attachment_dirname: str) -> str:
     """
     def repl(match):
         target = match.group("target")
+        if not _is_files_target(target):
+            return match.group(0)
         split = split_files_target(target)
         if not split:
             return match.group(0)
         _wrapped, rel_raw, rel_decoded = split
-        rel_posix = Path(rel_decoded).as_posix()
+        # rel_decoded comes from a forward-slash URL path, so it is already
+        # POSIX -- no Path round-trip needed.
         if attachment_dirname:
-            rel_posix = f"{attachment_dirname}/{rel_posix}"
-        new_target = safe_link_target(rel_posix)
-        return match.group(0).replace(target, new_target, 1)
+            new_target = safe_link_target(attachment_dirname + "/" + rel_decoded)
+        else:
+            new_target = safe_link_target(rel_decoded)
+        whole = match.group(0)
+        i = whole.index(target)
+        return whole[:i] + new_target + whole[i + len(target):]
 
     return LINK_RE.sub(repl, text)
 
@@ -316,6 +476,8 @@ def iter_attachments_in_text(text: str):
     """
     for match in LINK_RE.finditer(text):
         target = match.group("target")
+        if not _is_files_target(target):
+            continue
         split = split_files_target(target)
         if not split:
             continue
@@ -323,15 +485,105 @@ def iter_attachments_in_text(text: str):
         yield rel_raw, rel_decoded
 
 
-def process_markdown(content: str, attachment_dirname: str) -> Tuple[str, List[Tuple[str, str]]]:
+def _scan_markdown(content: str, attachment_dirname: str, wikilink_mode: "WikilinkMode",
+                   rewrite_links: bool) -> Tuple[str, List[Tuple[str, str]]]:
+    """Single-pass scanner shared by process_markdown and rewrite_wikilinks_safe.
+
+    Walks the content once with COMBINED_RE, tracking fence state from fence
+    matches and emitting large verbatim slices between rewrites instead of
+    iterating line-by-line with separate regex passes.
+    """
+    # Cheap substring pre-checks: when the content provably contains no
+    # Files/ reference and no convertible link, the whole scan is a no-op.
+    needs_links = rewrite_links and "Files/" in content
+    if wikilink_mode is WikilinkMode.TO_MARKDOWN:
+        needs_wiki = "[[" in content
+    elif wikilink_mode is WikilinkMode.TO_WIKILINK:
+        needs_wiki = ".md)" in content
+    else:
+        needs_wiki = False
+    if not needs_links and not needs_wiki:
+        return content, []
+
+    seen = set()
+    attachments = []
+    parts = []
+    last = 0
+    in_fence = False
+    fence_char = ""
+    fence_len = 0
+    # Resolve the per-mode wikilink handler and the rewritten-link prefix
+    # once, not per match.
+    wiki_fn = _WIKILINK_HANDLERS.get(wikilink_mode)
+    prefix = attachment_dirname + "/" if attachment_dirname else ""
+
+    for match in COMBINED_RE.finditer(content):
+        fence = match.group("fchars")
+        if fence is not None:
+            if not in_fence:
+                in_fence = True
+                fence_char = fence[0]
+                fence_len = len(fence)
+            elif fence[0] == fence_char and len(fence) >= fence_len:
+                in_fence = False
+            continue
+
+        if in_fence:
+            continue
+
+        replacement = None
+        if match.group("link") is not None:
+            target = match.group("target")
+            split = split_files_target(target) if _is_files_target(target) else None
+            if split and rewrite_links:
+                _wrapped, rel_raw, rel_decoded = split
+                # Deduplicate inline while preserving first-occurrence order.
+                # rel_decoded is derived from rel_raw, so the raw path is a
+                # sufficient key for repeats of the same spelling; distinct
+                # raws decoding to one file (a%20b.png vs "a b.png") are
+                # deduplicated by destination at copy time.
+                if rel_raw not in seen:
+                    seen.add(rel_raw)
+                    attachments.append((rel_raw, rel_decoded))
+                # rel_decoded comes from a forward-slash URL path, so it is
+                # already POSIX -- no Path round-trip needed.
+                new_target = safe_link_target(prefix + rel_decoded)
+                whole = match.group(0)
+                i = whole.index(target)
+                replacement = whole[:i] + new_target + whole[i + len(target):]
+            elif not split and wikilink_mode is WikilinkMode.TO_WIKILINK:
+                replacement = wiki_fn(match.group(0))
+        elif match.group("wiki") is not None:
+            if wikilink_mode is WikilinkMode.TO_MARKDOWN:
+                replacement = wiki_fn(match.group(0))
+        else:  # mdlink: .md links whose targets contain spaces
+            if wikilink_mode is WikilinkMode.TO_WIKILINK:
+                replacement = wiki_fn(match.group(0))
+
+        if replacement is not None and replacement != match.group(0):
+            parts.append(content[last:match.start()])
+            parts.append(replacement)
+            last = match.end()
+
+    if not parts:
+        return content, attachments
+    parts.append(content[last:])
+    return "".join(parts), attachments
+
+
+def process_markdown(content: str, attachment_dirname: str,
+                     wikilink_mode: Optional["WikilinkMode"] = None) -> Tuple[str, List[Tuple[str, str]]]:
     """Process markdown content: rewrite links and extract attachments.
 
     Rewrites Files/ attachment links while skipping code fences. Extracts unique
-    attachment references for copying.
+    attachment references for copying. Optionally converts wikilinks in the
+    same pass so each note is scanned only once.
 
     Args:
         content: Raw markdown content
         attachment_dirname: Subdirectory for attachments
+        wikilink_mode: Optional wikilink conversion applied in the same pass
+            (defaults to preserving wikilinks unchanged)
 
     Returns:
         Tuple of (processed_content, unique_attachments)
@@ -347,46 +599,49 @@ def process_markdown(content: str, attachment_dirname: str) -> Tuple[str, List[T
         >>> process_markdown("![](Files/img.png)", "_attachments")
         ("![](_attachments/img.png)", [("img.png", "img.png")])
     """
-    attachments = []
-    out_lines = []
-    in_fence = False
-    fence_char = ""
-    fence_len = 0
+    if wikilink_mode is None:
+        wikilink_mode = WikilinkMode.PRESERVE
+    text, attachments = _process_markdown_cached(content, attachment_dirname,
+                                                 wikilink_mode)
+    # Hand each caller its own list; the cached tuple stays immutable.
+    return text, list(attachments)
+
+
+@functools.lru_cache(maxsize=1024)
+def _process_markdown_cached(content: str, attachment_dirname: str,
+                             wikilink_mode: "WikilinkMode") -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """Memoized core of process_markdown.
+
+    Identical note content (duplicated notes, repeated runs in one
+    process) skips the whole scan. Strings cache their own hash, so
+    repeat lookups on the same object cost a dict probe.
+    """
+    text, attachments = _scan_markdown(content, attachment_dirname,
+                                       wikilink_mode, rewrite_links=True)
+    return text, tuple(attachments)
 
-    for line in content.splitlines(keepends=True):
-        match = FENCE_RE.match(line)
-        if match:
-            fence = match.group(1)
-            if not in_fence:
-                in_fence = True
-                fence_char = fence[0]
-                fence_len = len(fence)
-            else:
-                if fence[0] == fence_char and len(fence) >= fence_len:
-                    in_fence = False
-            out_lines.append(line)
-            continue
 
-        if in_fence:
-            out_lines.append(line)
-            continue
+def process_markdown_batch(contents: List[str], attachment_dirname: str,
+                           workers: Optional[int] = None) -> List[Tuple[str, List[Tuple[str, str]]]]:
+    """Process many markdown documents across a process pool.
 
-        for rel_raw, rel_decoded in iter_attachments_in_text(line):
-            attachments.append((rel_raw, rel_decoded))
+    process_markdown is pure and CPU-bound, so batches of independent
+    documents parallelize cleanly. The CLI already fans out whole notes
+    via --jobs; this helper serves library callers that hold raw content
+    rather than note files.
 
-        out_lines.append(rewrite_links_in_text(line, attachment_dirname))
-
-    # Deduplicate attachments while preserving order
-    seen = set()
-    unique_attachments = []
-    for rel_raw, rel_decoded in attachments:
-        key = (rel_raw, rel_decoded)
-        if key in seen:
-            continue
-        seen.add(key)
-        unique_attachments.append((rel_raw, rel_decoded))
+    Args:
+        contents: Raw markdown documents
+        attachment_dirname: Subdirectory for attachments
+        workers: Pool size (defaults to the CPU count)
 
-    return "".join(out_lines), unique_attachments
+    Returns:
+        One (processed_content, unique_attachments) tuple per document,
+        in input order.
+    """
+    fn = functools.partial(process_markdown, attachment_dirname=attachment_dirname)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(fn, contents, chunksize=32))
 
 
 def detect_wikilinks_in_text(text: str) -> List[WikiLink]:
@@ -431,64 +686,64 @@ def rewrite_wikilinks(text: str, mode: WikilinkMode) -> str:
         >>> rewrite_wikilinks("[[Note|Alias]]", WikilinkMode.TO_MARKDOWN)
         "[Alias](Note.md)"
     """
-    if mode == WikilinkMode.PRESERVE:
+    handler = _WIKILINK_HANDLERS.get(mode)
+    if handler is None:
         return text
-    elif mode == WikilinkMode.TO_MARKDOWN:
-        # Convert [[Target|Alias]] to [Alias](Target.md) or [[Target]] to [Target](Target.md)
-        def repl(match):
-            target = match.group(1).strip()
-            alias = match.group(2).strip() if match.group(2) else target
-            return f"[{alias}]({target}.md)"
-        return WIKILINK_RE.sub(repl, text)
-    elif mode == WikilinkMode.TO_WIKILINK:
-        # Convert [text](note.md) to [[note|text]]
-        # Match markdown links that point to .md files
-        md_link_re = re.compile(r'\[([^\]]+)\]\(([^)]+\.md)\)')
-        def repl(match):
-            text = match.group(1)
-            target = match.group(2).replace('.md', '')
-            # Remove path if present, just use filename
-            if '/' in target:
-                target = target.split('/')[-1]
-            # If text matches target (case-insensitive), use simple wikilink
-            if text.lower() == target.lower():
-                return f"[[{target}]]"
-            return f"[[{target}|{text}]]"
-        return md_link_re.sub(repl, text)
-    return text
+    return handler(text)
 
 
-def rewrite_wikilinks_safe(text: str, mode: WikilinkMode) -> str:
-    """Rewrite wikilinks while skipping fenced code blocks."""
-    if mode == WikilinkMode.PRESERVE:
+def _wikilink_to_markdown_repl(match) -> str:
+    # Convert [[Target|Alias]] to [Alias](Target.md) or [[Target]] to [Target](Target.md)
+    target = match.group(1).strip()
+    alias = match.group(2).strip() if match.group(2) else target
+    return f"[{alias}]({target}.md)"
+
+
+def _md_link_to_wikilink_repl(match) -> str:
+    # Convert [text](note.md) to [[note|text]]
+    text = match.group(1)
+    target = match.group(2).replace('.md', '')
+    # Remove path if present, just use filename
+    if '/' in target:
+        target = target.split('/')[-1]
+    # If text matches target (case-insensitive), use simple wikilink
+    if text.lower() == target.lower():
+        return f"[[{target}]]"
+    return f"[[{target}|{text}]]"
+
+
+def _wikilinks_to_markdown(text: str) -> str:
+    # Same C-level substring fast path as the .md-link direction below.
+    if "[[" not in text:
         return text
+    return WIKILINK_RE.sub(_wikilink_to_markdown_repl, text)
 
-    out_lines = []
-    in_fence = False
-    fence_char = ""
-    fence_len = 0
 
-    for line in text.splitlines(keepends=True):
-        match = FENCE_RE.match(line)
-        if match:
-            fence = match.group(1)
-            if not in_fence:
-                in_fence = True
-                fence_char = fence[0]
-                fence_len = len(fence)
-            else:
-                if fence[0] == fence_char and len(fence) >= fence_len:
-                    in_fence = False
-            out_lines.append(line)
-            continue
+def _md_links_to_wikilinks(text: str) -> str:
+    # Cheap C-level substring test; most text contains no .md link at all,
+    # so skip the regex engine entirely for it.
+    if ".md)" not in text:
+        return text
+    return MD_LINK_RE.sub(_md_link_to_wikilink_repl, text)
 
-        if in_fence:
-            out_lines.append(line)
-            continue
 
-        out_lines.append(rewrite_wikilinks(line, mode))
+# Per-mode substitution callables, resolved once instead of re-branching
+# (and re-compiling the .md link pattern) on every call.
+_WIKILINK_HANDLERS = {
+    WikilinkMode.TO_MARKDOWN: _wikilinks_to_markdown,
+    WikilinkMode.TO_WIKILINK: _md_links_to_wikilinks,
+}
+
+
+def rewrite_wikilinks_safe(text: str, mode: WikilinkMode) -> str:
+    """Rewrite wikilinks while skipping fenced code blocks."""
+    if mode is WikilinkMode.PRESERVE:
+        return text
+
+    rewritten, _attachments = _scan_markdown(text, "", mode, rewrite_links=False)
+    return rewritten
+
 
-    return "".join(out_lines)
 def convert_categories_to_tags(categories: Optional[List[str]], prefix: str = "") -> List[str]:
     """Convert UpNote categories to Obsidian tags.
 
@@ -511,19 +766,21 @@ def convert_categories_to_tags(categories: Optional[List[str]], prefix: str = ""
     if not categories:
         return []
 
-    tags = []
+    # dict preserves insertion order and gives O(1) dedup (the previous
+    # `tag not in tags` list scan was quadratic).
+    tags: Dict[str, None] = {}
     for category in categories:
-        # Split on "/" to get individual parts
-        parts = [p.strip() for p in category.split("/") if p.strip()]
-        for part in parts:
+        for part in category.split("/"):
+            part = part.strip()
+            if not part:
+                continue
             # Convert to lowercase and replace spaces with hyphens
             tag = part.replace(" ", "-").lower()
             if prefix:
                 tag = f"{prefix}{tag}"
-            if tag not in tags:
-                tags.append(tag)
+            tags[tag] = None
 
-    return tags
+    return list(tags)
 
 
 def relpath_display(path: Path, base_dir: Path) -> str:
@@ -562,8 +819,18 @@ def write_report(report_path: Path, report_format: str, data: Dict[str, Any]) ->
         >>> write_report(Path("report.json"), "json", report_data)
         >>> write_report(Path("report.md"), "md", report_data)
     """
+    notes = data.get("notes", [])
+    if notes and isinstance(notes[0], NoteReport):
+        data = {**data, "notes": [asdict(n) for n in notes]}
+
     if report_format == "json":
-        report_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        if orjson is not None:
+            report_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            # Stream straight to the file instead of building the whole
+            # pretty-printed report as an intermediate string.
+            with open(report_path, "w", encoding="utf-8") as fh:
+                json.dump(data, fh, indent=2, ensure_ascii=False)
         return
 
     # Markdown
@@ -638,6 +905,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Do not copy attachments (links are still rewritten).",
     )
+    parser.add_argument(
+        "--link-attachments",
+        action="store_true",
+        help="Hardlink attachments instead of copying when possible (same filesystem only).",
+    )
     parser.add_argument(
         "--fail-on-missing",
         action="store_true",
@@ -675,6 +947,17 @@ def parse_args() -> argparse.Namespace:
         default="",
         help="Prefix for converted tags (e.g., 'upnote/')",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for note processing (default: 1).",
+    )
+    parser.add_argument(
+        "--skip-empty-notes",
+        action="store_true",
+        help="Skip notes whose body is empty.",
+    )
     parser.add_argument(
         "--no-progress",
         action="store_true",
@@ -736,51 +1019,166 @@ def initialize_report(source_dir_display: str, base_dir: Path,
             "notes_processed": 0,
             "notes_written": 0,
             "attachments_copied": 0,
+            "attachments_skipped_uptodate": 0,
             "attachments_missing": 0,
         },
         "notes": [],
     }
 
 
+# Shared thread pool for attachment copies. Copies are I/O-bound and the
+# underlying read/write syscalls release the GIL, so overlapping them hides
+# disk latency; the pool is created lazily and reused for the whole run.
+_copy_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_copy_pool() -> ThreadPoolExecutor:
+    global _copy_pool
+    if _copy_pool is None:
+        _copy_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="attach-copy")
+    return _copy_pool
+
+
+# Directories already created during this run; lets ensure_dir skip the
+# mkdir syscall that would otherwise fire (and swallow EEXIST) per note.
+_dirs_created: set = set()
+
+
+def ensure_dir(path: Path) -> None:
+    """Create a directory once per run, skipping repeat mkdir syscalls.
+
+    Args:
+        path: Directory to create (parents included)
+    """
+    key = str(path)
+    if key in _dirs_created:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _dirs_created.add(key)
+
+
+def copy_attachment_file(source_path: Path, dest_path: Path,
+                         use_hardlink: bool = False) -> None:
+    """Copy a single attachment, preferring cheap primitives over copy2.
+
+    shutil.copy2 copies ownership, xattrs and flags via several extra
+    syscalls; for an export we only care about the bytes and the mtime.
+    shutil.copyfile dispatches to zero-copy syscalls (sendfile/fcopyfile)
+    where available, and os.utime restores the timestamp. With use_hardlink
+    the copy is skipped entirely when source and destination share a
+    filesystem.
+
+    Args:
+        source_path: Existing attachment file
+        dest_path: Destination file (parent directory must exist)
+        use_hardlink: Try os.link first, falling back to a copy
+    """
+    if use_hardlink:
+        try:
+            os.link(source_path, dest_path)
+            return
+        except FileExistsError:
+            # Destination already present -- fine if it is already a link
+            # of the source (shutil.copyfile would reject the same-inode
+            # pair); otherwise replace it with a fresh link.
+            if os.path.samefile(source_path, dest_path):
+                return
+            try:
+                os.unlink(dest_path)
+                os.link(source_path, dest_path)
+                return
+            except OSError:
+                pass
+        except OSError:
+            # Cross-device link or unsupported filesystem; fall back to copy.
+            pass
+    shutil.copyfile(source_path, dest_path)
+    st = os.stat(source_path)
+    # Nanosecond precision: the up-to-date check compares st_mtime_ns, and
+    # float seconds would round the destination slightly older than the
+    # source, defeating the skip on the next run.
+    os.utime(dest_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
 def copy_note_attachments(attachments: List[Tuple[str, str]], dest: Path,
                          source_dir: Path, attachment_dirname: str,
-                         args: argparse.Namespace) -> Tuple[int, List[str]]:
+                         args: argparse.Namespace,
+                         files_index: Optional[frozenset] = None) -> Tuple[int, int, List[str]]:
     """Copy attachments for a single destination.
 
+    Destinations that already hold an up-to-date copy (same size, mtime not
+    older than the source) are skipped without any I/O, which makes
+    incremental re-runs of the exporter nearly free; stale copies are
+    refreshed.
+
     Args:
         attachments: List of (raw_path, decoded_path) tuples
         dest: Destination directory
         source_dir: Source directory containing Files/
         attachment_dirname: Subdirectory name for attachments
         args: Command-line arguments
+        files_index: Optional pre-built index from build_files_index
 
     Returns:
-        Tuple of (attachments_copied_count, missing_attachments_list)
+        Tuple of (attachments_copied_count, attachments_skipped_count,
+        missing_attachments_list)
     """
     attachments_copied = 0
+    attachments_skipped = 0
     missing_attachments = []
 
     if args.skip_attachments:
-        return attachments_copied, missing_attachments
+        return attachments_copied, attachments_skipped, missing_attachments
 
     attachment_root = dest / attachment_dirname if attachment_dirname else dest
     if not args.dry_run:
-        attachment_root.mkdir(parents=True, exist_ok=True)
+        ensure_dir(attachment_root)
 
+    # Keyed on the destination: distinct raw spellings (a%20b.png vs
+    # "a b.png") decode to the same file, and submitting both would copy
+    # it twice concurrently and over-count.
+    copy_jobs: Dict[Path, Path] = {}
     for rel_raw, rel_decoded in attachments:
-        source_path = resolve_source_path(rel_raw, rel_decoded, source_dir)
+        source_path = resolve_source_path(rel_raw, rel_decoded, source_dir, files_index)
         if not source_path:
             missing_attachments.append(f"Files/{rel_raw}")
             continue
 
         dest_path = attachment_root / Path(rel_decoded)
         if not args.dry_run:
-            dest_path.parent.mkdir(parents=True, exist_ok=True)
-            if not dest_path.exists():
-                shutil.copy2(source_path, dest_path)
-                attachments_copied += 1
-
-    return attachments_copied, missing_attachments
+            # Most attachments live flat in attachment_root, which is
+            # already created above.
+            if dest_path.parent != attachment_root:
+                ensure_dir(dest_path.parent)
+            try:
+                dest_st = dest_path.stat()
+            except FileNotFoundError:
+                dest_st = None
+            if dest_st is not None:
+                src_st = source_path.stat()
+                if (src_st.st_size == dest_st.st_size
+                        and src_st.st_mtime_ns <= dest_st.st_mtime_ns):
+                    attachments_skipped += 1
+                    continue
+            copy_jobs[dest_path] = source_path
+
+    if copy_jobs:
+        use_hardlink = getattr(args, "link_attachments", False)
+        if len(copy_jobs) == 1:
+            (dst, src), = copy_jobs.items()
+            copy_attachment_file(src, dst, use_hardlink)
+        else:
+            # Overlap the blocking file copies; wait at end-of-note so
+            # counts and error propagation stay deterministic.
+            futures = [
+                _get_copy_pool().submit(copy_attachment_file, src, dst, use_hardlink)
+                for dst, src in copy_jobs.items()
+            ]
+            for future in futures:
+                future.result()
+        attachments_copied = len(copy_jobs)
+
+    return attachments_copied, attachments_skipped, missing_attachments
 
 
 def write_note_to_destinations(note, post_content: str, note_path: Path,
@@ -797,17 +1195,20 @@ def write_note_to_destinations(note, post_content: str, note_path: Path,
     Returns:
         Number of notes written
     """
-    notes_written = 0
+    if args.dry_run:
+        return 0
 
+    # Serialize once per note; duplicated notes reuse the same bytes for
+    # every destination instead of re-dumping the YAML header per copy.
+    note.content = post_content
+    output = frontmatter.dumps(note) if args.keep_frontmatter else post_content
+    payload = output.encode("utf-8")
+
+    notes_written = 0
     for dest in destinations:
-        if not args.dry_run:
-            dest.mkdir(parents=True, exist_ok=True)
-            note.content = post_content
-            output = frontmatter.dumps(note) if args.keep_frontmatter else post_content
-            out_path = dest / note_path.name
-            with open(out_path, "w", encoding="utf-8") as outfile:
-                outfile.write(output)
-            notes_written += 1
+        ensure_dir(dest)
+        (dest / note_path.name).write_bytes(payload)
+        notes_written += 1
 
     return notes_written
 
@@ -847,16 +1248,16 @@ def validate_migration_setup(source_dir: Path, base_dir: Path,
         errors.append(f"Source is not a directory: {source_dir}")
         return errors
 
-    # Check for markdown files
-    md_files = list(source_dir.glob("*.md"))
-    if not md_files:
+    # Check for markdown files (stop at the first hit instead of globbing
+    # the whole directory into Path objects)
+    if next(iter_md_files(source_dir), None) is None:
         errors.append(f"No .md files found in source directory: {source_dir}")
 
     # Check Files/ directory if processing attachments
     if not skip_attachments:
         files_dir = source_dir / "Files"
         if not files_dir.exists():
-            logger.warning(f"Files/ directory not found: {files_dir}")
+            logger.warning("Files/ directory not found: %s", files_dir)
             logger.warning("Attachments may be missing. Consider using --skip-attachments if no attachments expected.")
         elif not files_dir.is_dir():
             errors.append(f"Files/ exists but is not a directory: {files_dir}")
@@ -877,6 +1278,103 @@ def validate_migration_setup(source_dir: Path, base_dir: Path,
     return errors
 
 
+def process_one_note(path: Path, source_dir: Path, base_dir: Path,
+                     attachment_dirname: str, args: argparse.Namespace,
+                     files_index: frozenset,
+                     wikilink_mode: Optional[WikilinkMode] = None,
+                     ) -> Optional[Tuple[NoteReport, int, int, int]]:
+    """Process a single note end-to-end.
+
+    Reads, rewrites and writes one note plus its attachments, returning
+    result data instead of mutating shared state. Notes are independent of
+    each other, so this runs equally well inline or in a worker process
+    (see --jobs).
+
+    Args:
+        path: Path to the markdown note
+        source_dir: Source directory containing Files/
+        base_dir: Output base directory
+        attachment_dirname: Subdirectory name for attachments
+        args: Command-line arguments
+        files_index: Pre-built index from build_files_index
+        wikilink_mode: Resolved wikilink mode; defaults to resolving
+            args.wikilink_mode (callers with many notes resolve it once)
+
+    Returns:
+        Tuple of (note_report, attachments_copied, attachments_skipped,
+        notes_written), or None if the note was skipped as empty.
+    """
+    # Load note and get destinations (one raw read, one decode, C YAML loader)
+    note = frontmatter.loads(path.read_bytes().decode("utf-8"),
+                             handler=_FRONTMATTER_HANDLER)
+    post_content = note.content
+    if args.skip_empty_notes and not post_content.strip():
+        logger.debug("Skipping empty note %s", path.name)
+        return None
+
+    destinations = normalize_categories(note.get("categories"), base_dir)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Note destinations: %s", [str(d) for d in destinations])
+
+    # Deduplicate destinations while preserving order
+    unique_destinations = list(dict.fromkeys(destinations))
+
+    logger.info("Processing note %s", path.name)
+
+    # Process markdown and extract attachments; wikilink conversion (if
+    # requested) happens in the same scan so each note is walked once.
+    if wikilink_mode is None:
+        wikilink_mode = WikilinkMode(args.wikilink_mode)
+    post_content, attachments = process_markdown(
+        post_content, attachment_dirname, wikilink_mode
+    )
+    logger.debug("Extracted %d attachments from %s", len(attachments), path.name)
+
+    # Convert categories to tags if requested
+    if args.convert_tags:
+        categories = note.get("categories", [])
+        if isinstance(categories, str):
+            categories = [categories]
+        tags = convert_categories_to_tags(categories, args.tag_prefix)
+        if tags:
+            # Add tags to frontmatter (merge with existing tags)
+            existing_tags = note.get("tags", [])
+            if isinstance(existing_tags, str):
+                existing_tags = [existing_tags]
+            # Deduplicate while preserving order (stable output, fewer allocs)
+            note["tags"] = list(dict.fromkeys((*existing_tags, *tags)))
+            logger.debug("Added tags to %s: %s", path.name, tags)
+
+    # Build note report
+    note_report = NoteReport(
+        note=path.name,
+        destinations=[relpath_display(d, base_dir) for d in unique_destinations],
+        attachments=[rel_raw for rel_raw, _ in attachments],
+        attachments_count=len(attachments),
+    )
+
+    # Process each destination
+    attachments_copied = 0
+    attachments_skipped = 0
+    for dest in unique_destinations:
+        copied, skipped, missing = copy_note_attachments(attachments, dest, source_dir,
+                                                        attachment_dirname, args, files_index)
+        attachments_copied += copied
+        attachments_skipped += skipped
+        note_report.missing_attachments.extend(missing)
+
+        # Log missing attachments
+        for missing_att in missing:
+            logger.warning("Missing attachment %s referenced by %s", missing_att, path.name)
+
+    # Write note to destinations
+    notes_written = write_note_to_destinations(note, post_content, path,
+                                               unique_destinations, args)
+
+    note_report.missing_attachments_count = len(note_report.missing_attachments)
+    return note_report, attachments_copied, attachments_skipped, notes_written
+
+
 def main() -> None:
     """Main entry point for UpNote to Obsidian migration."""
     args = parse_args()
@@ -899,10 +1397,10 @@ def main() -> None:
     base_dir = Path(args.base_dir)
     attachment_dirname = args.attachments_dir.strip()
 
-    logger.debug(f"Source directory: {source_dir}")
-    logger.debug(f"Base directory: {base_dir}")
-    logger.debug(f"Attachments subdirectory: {attachment_dirname if attachment_dirname else '(none)'}")
-    logger.debug(f"Dry run: {args.dry_run}")
+    logger.debug("Source directory: %s", source_dir)
+    logger.debug("Base directory: %s", base_dir)
+    logger.debug("Attachments subdirectory: %s", attachment_dirname if attachment_dirname else "(none)")
+    logger.debug("Dry run: %s", args.dry_run)
 
     # Run pre-flight validation
     logger.info("Running pre-flight validation...")
@@ -913,7 +1411,7 @@ def main() -> None:
     if validation_errors:
         logger.error("Validation failed:")
         for error in validation_errors:
-            logger.error(f"  - {error}")
+            logger.error("  - %s", error)
         sys.exit(1)
 
     logger.info("Pre-flight validation passed")
@@ -925,109 +1423,86 @@ def main() -> None:
 
     if not args.dry_run:
         base_dir.mkdir(parents=True, exist_ok=True)
-        logger.debug(f"Created output directory: {base_dir}")
+        logger.debug("Created output directory: %s", base_dir)
+
+    # Index the Files/ directory once so attachment existence checks are
+    # set lookups rather than per-attachment stat calls.
+    files_index = build_files_index(source_dir) if not args.skip_attachments else frozenset()
 
     # Initialize report
     report = initialize_report(source_dir_display, base_dir, attachment_dirname, args)
     missing_attachments_total = 0
     note_index = 0
 
-    # Get list of markdown files
-    note_paths = [p for p in source_dir.iterdir() if p.is_file() and p.suffix.lower() == ".md"]
-    note_paths.sort(key=lambda p: p.name.lower())
+    # Get list of markdown files (materialized only for deterministic
+    # ordering and the progress total); DirEntry objects keep their stat
+    # results cached for the empty-note pre-filter below.
+    note_entries = list(iter_md_files(source_dir))
+    note_entries.sort(key=lambda e: e.name.lower())
+
+    logger.info("Found %d markdown files to process", len(note_entries))
 
-    logger.info(f"Found {len(note_paths)} markdown files to process")
+    # Zero-byte files provably have no body; skip them without even
+    # reading when empty notes are unwanted (DirEntry.stat is cached).
+    # Anything larger goes through the body check in process_one_note.
+    if args.skip_empty_notes:
+        note_paths = [Path(e.path) for e in note_entries if e.stat().st_size > 0]
+    else:
+        note_paths = [Path(e.path) for e in note_entries]
+
+    worker = functools.partial(
+        process_one_note,
+        source_dir=source_dir,
+        base_dir=base_dir,
+        attachment_dirname=attachment_dirname,
+        args=args,
+        files_index=files_index,
+        wikilink_mode=WikilinkMode(args.wikilink_mode),
+    )
+
+    # Notes are independent, so with --jobs > 1 fan the per-note work out
+    # to a process pool and reduce the results back into the report here.
+    jobs = max(1, args.jobs)
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    if executor is not None:
+        results = executor.map(worker, note_paths, chunksize=16)
+    else:
+        results = map(worker, note_paths)
 
     # Add progress bar if available and not disabled
     if tqdm and not args.no_progress and sys.stdout.isatty():
-        note_paths = tqdm(note_paths, desc="Processing notes", unit="note")
+        # Cap refresh rate: per-note redraws cost real time on large runs
+        results = tqdm(results, desc="Processing notes", unit="note",
+                       total=len(note_paths), mininterval=0.5,
+                       miniters=max(1, len(note_paths) // 200), smoothing=0.1)
     elif not sys.stdout.isatty():
         logger.debug("TTY not detected, progress bar disabled")
 
-    # Process all markdown notes
-    for path in note_paths:
-        note_index += 1
-        report["summary"]["notes_processed"] += 1
-
-        # Load note and get destinations
-        note = frontmatter.load(path)
-        post_content = note.content
-        destinations = normalize_categories(note.get("categories"), base_dir)
-
-        logger.debug(f"Note destinations: {[str(d) for d in destinations]}")
-
-        # Deduplicate destinations while preserving order
-        seen = set()
-        unique_destinations = []
-        for d in destinations:
-            if d not in seen:
-                seen.add(d)
-                unique_destinations.append(d)
-
-        logger.info(f"Processing note {path.name}")
-
-        # Process markdown and extract attachments
-        post_content, attachments = process_markdown(post_content, attachment_dirname)
-        logger.debug(f"Extracted {len(attachments)} attachments from {path.name}")
-
-        # Apply wikilink conversion if requested
-        if args.wikilink_mode != "preserve":
-            wikilink_mode = WikilinkMode(args.wikilink_mode)
-            post_content = rewrite_wikilinks_safe(post_content, wikilink_mode)
-
-        # Convert categories to tags if requested
-        if args.convert_tags:
-            categories = note.get("categories", [])
-            if isinstance(categories, str):
-                categories = [categories]
-            tags = convert_categories_to_tags(categories, args.tag_prefix)
-            if tags:
-                # Add tags to frontmatter (merge with existing tags)
-                existing_tags = note.get("tags", [])
-                if isinstance(existing_tags, str):
-                    existing_tags = [existing_tags]
-                all_tags = list(set(existing_tags + tags))  # Deduplicate
-                note["tags"] = all_tags
-                logger.debug(f"Added tags to {path.name}: {tags}")
-
-        # Build note report
-        note_title = path.name if not args.report_redact else f"note-{note_index}"
-        note_report = {
-            "note": note_title,
-            "destinations": [relpath_display(d, base_dir) for d in unique_destinations],
-            "attachments": [rel_raw for rel_raw, _ in attachments],
-            "missing_attachments": [],
-            "attachments_count": len(attachments),
-            "missing_attachments_count": 0,
-        }
-
-        # Process each destination
-        for dest in unique_destinations:
-            # Copy attachments
-            copied, missing = copy_note_attachments(attachments, dest, source_dir,
-                                                   attachment_dirname, args)
-            report["summary"]["attachments_copied"] += copied
-            note_report["missing_attachments"].extend(missing)
-
-            # Log missing attachments
-            for missing_att in missing:
-                logger.warning(f"Missing attachment {missing_att} referenced by {path.name}")
-                report["summary"]["attachments_missing"] += 1
-                missing_attachments_total += 1
-
-        # Write note to destinations
-        notes_written = write_note_to_destinations(note, post_content, path,
-                                                   unique_destinations, args)
-        report["summary"]["notes_written"] += notes_written
-
-        # Finalize note report
-        note_report["missing_attachments_count"] = len(note_report["missing_attachments"])
-        if args.report_redact:
-            note_report["attachments"] = []
-            note_report["missing_attachments"] = []
-            note_report["destinations"] = []
-
-        report["notes"].append(note_report)
+    try:
+        for result in results:
+            if result is None:
+                continue
+            note_report, attachments_copied, attachments_skipped, notes_written = result
+
+            note_index += 1
+            report["summary"]["notes_processed"] += 1
+            report["summary"]["attachments_copied"] += attachments_copied
+            report["summary"]["attachments_skipped_uptodate"] += attachments_skipped
+            report["summary"]["notes_written"] += notes_written
+            missing_count = note_report.missing_attachments_count
+            report["summary"]["attachments_missing"] += missing_count
+            missing_attachments_total += missing_count
+
+            if args.report_redact:
+                note_report.note = f"note-{note_index}"
+                note_report.attachments = []
+                note_report.missing_attachments = []
+                note_report.destinations = []
+
+            report["notes"].append(note_report)
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     # Write final report
     report_path = Path(args.report)
@@ -1035,14 +1510,15 @@ def main() -> None:
 
     # Exit with error if missing attachments and fail_on_missing is set
     if args.fail_on_missing and missing_attachments_total > 0:
-        logger.error(f"Missing attachments detected: {missing_attachments_total}")
+        logger.error("Missing attachments detected: %d", missing_attachments_total)
         sys.exit(1)
 
-    logger.info(f"Migration complete: {report['summary']['notes_processed']} notes processed, "
-                f"{report['summary']['notes_written']} notes written, "
-                f"{report['summary']['attachments_copied']} attachments copied")
+    logger.info("Migration complete: %d notes processed, %d notes written, %d attachments copied",
+                report["summary"]["notes_processed"],
+                report["summary"]["notes_written"],
+                report["summary"]["attachments_copied"])
     if missing_attachments_total > 0:
-        logger.warning(f"Total missing attachments: {missing_attachments_total}")
+        logger.warning("Total missing attachments: %d", missing_attachments_total)
 
 
 if __name__ == "__main__":
@@ -89,14 +89,14 @@ categories: Empty
 """
 
 
-@pytest.fixture
-def sample_attachment_image(tmp_path):
-    """Create a sample image file.
+@pytest.fixture(scope="session")
+def sample_attachment_image(tmp_path_factory):
+    """Create a sample image file (session-scoped: the bytes never change).
 
     Returns:
         Path to created image file
     """
-    img_path = tmp_path / "test_image.png"
+    img_path = tmp_path_factory.mktemp("attachments") / "test_image.png"
     # Create a minimal valid PNG file (1x1 transparent pixel)
     png_data = (
         b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01'
@@ -107,14 +107,14 @@ def sample_attachment_image(tmp_path):
     return img_path
 
 
-@pytest.fixture
-def sample_attachment_pdf(tmp_path):
-    """Create a sample PDF file.
+@pytest.fixture(scope="session")
+def sample_attachment_pdf(tmp_path_factory):
+    """Create a sample PDF file (session-scoped: the bytes never change).
 
     Returns:
         Path to created PDF file
     """
-    pdf_path = tmp_path / "test_doc.pdf"
+    pdf_path = tmp_path_factory.mktemp("attachments") / "test_doc.pdf"
     # Create a minimal valid PDF file
     pdf_data = b"""%PDF-1.4
 1 0 obj
@@ -1,6 +1,7 @@
 """Integration tests for UpNote Reorganizer."""
 
 import json
+import tempfile
 import unittest
 from pathlib import Path
 from argparse import Namespace
@@ -9,6 +10,7 @@ import frontmatter
 
 from UpNote_Reorganizer import (
     initialize_report,
+    copy_attachment_file,
     copy_note_attachments,
     write_note_to_destinations,
     write_report,
@@ -16,6 +18,19 @@ from UpNote_Reorganizer import (
 )
 
 
+class TempDirTestCase(unittest.TestCase):
+    """Base class providing a per-test temporary directory.
+
+    Creates one temp dir per test and removes it on teardown, replacing
+    the mkdtemp boilerplate (which also leaked directories) in each test.
+    """
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp_path = Path(tmp.name)
+
+
 class TestInitializeReport(unittest.TestCase):
     """Tests for initialize_report function."""
 
@@ -36,6 +51,7 @@ class TestInitializeReport(unittest.TestCase):
         self.assertEqual(report["attachments_dir"], "_attachments")
         self.assertIn("summary", report)
         self.assertEqual(report["summary"]["notes_processed"], 0)
+        self.assertEqual(report["summary"]["attachments_skipped_uptodate"], 0)
 
     def test_redacted_report(self):
         """Test report with redaction enabled."""
@@ -51,47 +67,42 @@ class TestInitializeReport(unittest.TestCase):
         self.assertEqual(report["base_dir"], "<redacted>")
 
 
-class TestCopyNoteAttachments(unittest.TestCase):
+class TestCopyNoteAttachments(TempDirTestCase):
     """Tests for copy_note_attachments function."""
 
+    def setUp(self):
+        super().setUp()
+        self.source_dir = self.tmp_path / "source"
+        self.dest_dir = self.tmp_path / "dest"
+        self.source_dir.mkdir()
+        self.dest_dir.mkdir()
+        (self.source_dir / "Files").mkdir()
+
     def test_copy_attachments_dry_run(self):
         """Dry run should not copy files."""
-        import tempfile
-        tmp_path = Path(tempfile.mkdtemp())
-        source_dir = tmp_path / "source"
-        dest_dir = tmp_path / "dest"
-        source_dir.mkdir()
-        dest_dir.mkdir()
-        (source_dir / "Files").mkdir()
-
         # Create test file
-        test_file = source_dir / "Files" / "test.png"
+        test_file = self.source_dir / "Files" / "test.png"
         test_file.write_text("test")
 
         args = Namespace(dry_run=True, skip_attachments=False)
         attachments = [("test.png", "test.png")]
 
-        copied, missing = copy_note_attachments(
-            attachments, dest_dir, source_dir, "_attachments", args
+        copied, skipped, missing = copy_note_attachments(
+            attachments, self.dest_dir, self.source_dir, "_attachments", args
         )
 
         self.assertEqual(copied, 0)
         self.assertEqual(missing, [])
         # File should not exist in destination
-        self.assertFalse((dest_dir / "_attachments" / "test.png").exists())
+        self.assertFalse((self.dest_dir / "_attachments" / "test.png").exists())
 
     def test_copy_attachments_skip(self):
         """Skip attachments should not copy."""
-        import tempfile
-        tmp_path = Path(tempfile.mkdtemp())
-        dest_dir = tmp_path / "dest"
-        dest_dir.mkdir()
-
         args = Namespace(dry_run=False, skip_attachments=True)
         attachments = [("test.png", "test.png")]
 
-        copied, missing = copy_note_attachments(
-            attachments, dest_dir, tmp_path, "_attachments", args
+        copied, skipped, missing = copy_note_attachments(
+            attachments, self.dest_dir, self.tmp_path, "_attachments", args
         )
 
         self.assertEqual(copied, 0)
@@ -99,19 +110,11 @@ class TestCopyNoteAttachments(unittest.TestCase):
 
     def test_copy_missing_attachment(self):
         """Missing attachment should be reported."""
-        import tempfile
-        tmp_path = Path(tempfile.mkdtemp())
-        source_dir = tmp_path / "source"
-        dest_dir = tmp_path / "dest"
-        source_dir.mkdir()
-        dest_dir.mkdir()
-        (source_dir / "Files").mkdir()
-
         args = Namespace(dry_run=False, skip_attachments=False)
         attachments = [("missing.png", "missing.png")]
 
-        copied, missing = copy_note_attachments(
-            attachments, dest_dir, source_dir, "_attachments", args
+        copied, skipped, missing = copy_note_attachments(
+            attachments, self.dest_dir, self.source_dir, "_attachments", args
         )
 
         self.assertEqual(copied, 0)
@@ -120,69 +123,171 @@ class TestCopyNoteAttachments(unittest.TestCase):
 
     def test_copy_real_attachment(self):
         """Actually copy attachment file."""
-        import tempfile
-        tmp_path = Path(tempfile.mkdtemp())
-        source_dir = tmp_path / "source"
-        dest_dir = tmp_path / "dest"
-        source_dir.mkdir()
-        dest_dir.mkdir()
-        (source_dir / "Files").mkdir()
-
         # Create test file
-        test_file = source_dir / "Files" / "test.png"
+        test_file = self.source_dir / "Files" / "test.png"
         test_file.write_text("test content")
 
         args = Namespace(dry_run=False, skip_attachments=False)
         attachments = [("test.png", "test.png")]
 
-        copied, missing = copy_note_attachments(
-            attachments, dest_dir, source_dir, "_attachments", args
+        copied, skipped, missing = copy_note_attachments(
+            attachments, self.dest_dir, self.source_dir, "_attachments", args
         )
 
         self.assertEqual(copied, 1)
         self.assertEqual(missing, [])
         # File should exist in destination
-        dest_file = dest_dir / "_attachments" / "test.png"
+        dest_file = self.dest_dir / "_attachments" / "test.png"
         self.assertTrue(dest_file.exists())
         self.assertEqual(dest_file.read_text(), "test content")
 
+    def test_copy_dedupes_raw_spellings_of_same_file(self):
+        """Two raw spellings decoding to one file copy it exactly once."""
+        test_file = self.source_dir / "Files" / "a b.png"
+        test_file.write_text("shared")
+
+        args = Namespace(dry_run=False, skip_attachments=False)
+        attachments = [("a%20b.png", "a b.png"), ("a b.png", "a b.png")]
+
+        copied, skipped, missing = copy_note_attachments(
+            attachments, self.dest_dir, self.source_dir, "_attachments", args
+        )
+
+        self.assertEqual((copied, skipped, missing), (1, 0, []))
+        self.assertEqual(
+            (self.dest_dir / "_attachments" / "a b.png").read_text(), "shared"
+        )
+
+    def test_copy_skips_up_to_date_destination(self):
+        """Second run over an unchanged attachment skips the copy."""
+        test_file = self.source_dir / "Files" / "test.png"
+        test_file.write_text("test content")
+
+        args = Namespace(dry_run=False, skip_attachments=False)
+        attachments = [("test.png", "test.png")]
+
+        copied, skipped, missing = copy_note_attachments(
+            attachments, self.dest_dir, self.source_dir, "_attachments", args
+        )
+        self.assertEqual((copied, skipped, missing), (1, 0, []))
+
+        copied, skipped, missing = copy_note_attachments(
+            attachments, self.dest_dir, self.source_dir, "_attachments", args
+        )
+        self.assertEqual((copied, skipped, missing), (0, 1, []))
+
+    def test_copy_refreshes_stale_destination(self):
+        """A changed source attachment overwrites the stale copy."""
+        import os
+
+        test_file = self.source_dir / "Files" / "test.png"
+        test_file.write_text("old content")
+
+        args = Namespace(dry_run=False, skip_attachments=False)
+        attachments = [("test.png", "test.png")]
+
+        copy_note_attachments(
+            attachments, self.dest_dir, self.source_dir, "_attachments", args
+        )
+
+        # Re-export after the source changed (newer mtime, new size)
+        test_file.write_text("updated content")
+        st = test_file.stat()
+        os.utime(test_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        copied, skipped, missing = copy_note_attachments(
+            attachments, self.dest_dir, self.source_dir, "_attachments", args
+        )
+
+        self.assertEqual((copied, skipped, missing), (1, 0, []))
+        dest_file = self.dest_dir / "_attachments" / "test.png"
+        self.assertEqual(dest_file.read_text(), "updated content")
+
+
+class TestCopyAttachmentFile(TempDirTestCase):
+    """Tests for copy_attachment_file function."""
+
+    def setUp(self):
+        super().setUp()
+        self.source = self.tmp_path / "source.png"
+        self.source.write_text("attachment bytes")
+        self.dest = self.tmp_path / "dest.png"
+
+    def test_hardlink_shares_inode(self):
+        """Hardlinked destination is the same file, not a copy."""
+        copy_attachment_file(self.source, self.dest, use_hardlink=True)
+
+        self.assertEqual(self.dest.read_text(), "attachment bytes")
+        self.assertEqual(self.dest.stat().st_ino, self.source.stat().st_ino)
+
+    def test_hardlink_falls_back_to_copy(self):
+        """os.link failing (e.g. cross-device) falls back to a real copy."""
+        from unittest import mock
+
+        with mock.patch("UpNote_Reorganizer.os.link",
+                        side_effect=OSError("cross-device link")):
+            copy_attachment_file(self.source, self.dest, use_hardlink=True)
+
+        self.assertEqual(self.dest.read_text(), "attachment bytes")
+        self.assertNotEqual(self.dest.stat().st_ino, self.source.stat().st_ino)
+
+    def test_hardlink_to_existing_link_is_idempotent(self):
+        """Linking again onto an existing link of the source succeeds."""
+        copy_attachment_file(self.source, self.dest, use_hardlink=True)
+        copy_attachment_file(self.source, self.dest, use_hardlink=True)
+
+        self.assertEqual(self.dest.read_text(), "attachment bytes")
+        self.assertEqual(self.dest.stat().st_ino, self.source.stat().st_ino)
 
-class TestWriteNoteToDestinations(unittest.TestCase):
+    def test_hardlink_replaces_existing_copy(self):
+        """An existing plain copy at the destination gets relinked."""
+        self.dest.write_text("stale copy")
+
+        copy_attachment_file(self.source, self.dest, use_hardlink=True)
+
+        self.assertEqual(self.dest.read_text(), "attachment bytes")
+        self.assertEqual(self.dest.stat().st_ino, self.source.stat().st_ino)
+
+    def test_plain_copy_preserves_mtime(self):
+        """Default copy keeps the source's modification time."""
+        copy_attachment_file(self.source, self.dest)
+
+        self.assertEqual(self.dest.read_text(), "attachment bytes")
+        self.assertEqual(int(self.dest.stat().st_mtime),
+                         int(self.source.stat().st_mtime))
+
+
+class TestWriteNoteToDestinations(TempDirTestCase):
     """Tests for write_note_to_destinations function."""
 
+    def setUp(self):
+        super().setUp()
+        self.dest_dir = self.tmp_path / "dest"
+        self.dest_dir.mkdir()
+
     def test_write_note_dry_run(self):
         """Dry run should not write files."""
-        import tempfile
-        tmp_path = Path(tempfile.mkdtemp())
-        dest_dir = tmp_path / "dest"
-        dest_dir.mkdir()
-
         note = frontmatter.loads("---\ntitle: Test\n---\nContent")
         args = Namespace(dry_run=True, keep_frontmatter=True)
 
         written = write_note_to_destinations(
-            note, "Content", Path("test.md"), [dest_dir], args
+            note, "Content", Path("test.md"), [self.dest_dir], args
         )
 
         self.assertEqual(written, 0)
-        self.assertFalse((dest_dir / "test.md").exists())
+        self.assertFalse((self.dest_dir / "test.md").exists())
 
     def test_write_note_with_frontmatter(self):
         """Write note keeping frontmatter."""
-        import tempfile
-        tmp_path = Path(tempfile.mkdtemp())
-        dest_dir = tmp_path / "dest"
-        dest_dir.mkdir()
-
         note = frontmatter.loads("---\ntitle: Test\n---\nContent")
         args = Namespace(dry_run=False, keep_frontmatter=True)
 
         written = write_note_to_destinations(
-            note, "Content", Path("test.md"), [dest_dir], args
+            note, "Content", Path("test.md"), [self.dest_dir], args
         )
 
         self.assertEqual(written, 1)
-        output_file = dest_dir / "test.md"
+        output_file = self.dest_dir / "test.md"
         self.assertTrue(output_file.exists())
 
         # Check frontmatter is present
@@ -192,20 +297,15 @@ class TestWriteNoteToDestinations(unittest.TestCase):
 
     def test_write_note_without_frontmatter(self):
         """Write note without frontmatter."""
-        import tempfile
-        tmp_path = Path(tempfile.mkdtemp())
-        dest_dir = tmp_path / "dest"
-        dest_dir.mkdir()
-
         note = frontmatter.loads("---\ntitle: Test\n---\nContent")
         args = Namespace(dry_run=False, keep_frontmatter=False)
 
         written = write_note_to_destinations(
-            note, "Content", Path("test.md"), [dest_dir], args
+            note, "Content", Path("test.md"), [self.dest_dir], args
         )
 
         self.assertEqual(written, 1)
-        output_file = dest_dir / "test.md"
+        output_file = self.dest_dir / "test.md"
         self.assertTrue(output_file.exists())
 
         # Check no frontmatter
@@ -215,10 +315,8 @@ class TestWriteNoteToDestinations(unittest.TestCase):
 
     def test_write_multiple_destinations(self):
         """Write note to multiple destinations."""
-        import tempfile
-        tmp_path = Path(tempfile.mkdtemp())
-        dest1 = tmp_path / "dest1"
-        dest2 = tmp_path / "dest2"
+        dest1 = self.tmp_path / "dest1"
+        dest2 = self.tmp_path / "dest2"
         dest1.mkdir()
         dest2.mkdir()
 
@@ -234,14 +332,12 @@ class TestWriteNoteToDestinations(unittest.TestCase):
         self.assertTrue((dest2 / "test.md").exists())
 
 
-class TestWriteReport(unittest.TestCase):
+class TestWriteReport(TempDirTestCase):
     """Tests for write_report function."""
 
     def test_write_json_report(self):
         """Write report in JSON format."""
-        import tempfile
-        tmp_path = Path(tempfile.mkdtemp())
-        report_file = tmp_path / "report.json"
+        report_file = self.tmp_path / "report.json"
 
         report_data = {
             "generated_utc": "2024-01-01T00:00:00Z",
@@ -258,9 +354,7 @@ class TestWriteReport(unittest.TestCase):
 
     def test_write_markdown_report(self):
         """Write report in Markdown format."""
-        import tempfile
-        tmp_path = Path(tempfile.mkdtemp())
-        report_file = tmp_path / "report.md"
+        report_file = self.tmp_path / "report.md"
 
         report_data = {
             "generated_utc": "2024-01-01T00:00:00Z",
@@ -293,15 +387,68 @@ class TestWriteReport(unittest.TestCase):
         self.assertIn("test.md", content)
 
 
-class TestFullWorkflow(unittest.TestCase):
+class TestParallelJobs(TempDirTestCase):
+    """End-to-end runs must be identical regardless of --jobs."""
+
+    def setUp(self):
+        super().setUp()
+        self.source_dir = self.tmp_path / "source"
+        self.source_dir.mkdir()
+        (self.source_dir / "Files").mkdir()
+        for i in range(4):
+            (self.source_dir / f"note{i}.md").write_text(
+                f"---\ncategories: Cat{i % 2}\n---\n# Note {i}\n"
+                f"![img](Files/img{i}.png)\n"
+            )
+            (self.source_dir / "Files" / f"img{i}.png").write_text(f"image {i}")
+
+    def _run_migration(self, jobs):
+        """Run the CLI against the sample vault; return (files, summary)."""
+        import subprocess
+        import sys
+
+        out_dir = self.tmp_path / f"out-jobs{jobs}"
+        report_file = self.tmp_path / f"report-jobs{jobs}.json"
+        script = Path(__file__).resolve().parent.parent / "UpNote_Reorganizer.py"
+        subprocess.run(
+            [
+                sys.executable, str(script),
+                "--source-dir", str(self.source_dir),
+                "--base-dir", str(out_dir),
+                "--attachments-dir", "_attachments",
+                "--keep-frontmatter",
+                "--report", str(report_file),
+                "--jobs", str(jobs),
+                "--no-progress",
+            ],
+            check=True, capture_output=True,
+        )
+        files = {
+            str(p.relative_to(out_dir)): p.read_text()
+            for p in sorted(out_dir.rglob("*")) if p.is_file()
+        }
+        summary = json.loads(report_file.read_text())["summary"]
+        return files, summary
+
+    def test_jobs_match_serial_run(self):
+        """--jobs 2 produces the same outputs and summary as --jobs 1."""
+        serial_files, serial_summary = self._run_migration(1)
+        parallel_files, parallel_summary = self._run_migration(2)
+
+        self.assertEqual(serial_summary["notes_processed"], 4)
+        self.assertEqual(serial_summary["notes_written"], 4)
+        self.assertEqual(serial_summary["attachments_copied"], 4)
+        self.assertEqual(parallel_files, serial_files)
+        self.assertEqual(parallel_summary, serial_summary)
+
+
+class TestFullWorkflow(TempDirTestCase):
     """End-to-end tests simulating full migration workflow."""
 
     def test_full_migration_single_note(self):
         """Test complete migration of a single note with attachment."""
-        import tempfile
-        tmp_path = Path(tempfile.mkdtemp())
-        source_dir = tmp_path / "source"
-        output_dir = tmp_path / "output"
+        source_dir = self.tmp_path / "source"
+        output_dir = self.tmp_path / "output"
         source_dir.mkdir()
         output_dir.mkdir()
         (source_dir / "Files").mkdir()
@@ -5,6 +5,7 @@ from UpNote_Reorganizer import (
     rewrite_links_in_text,
     iter_attachments_in_text,
     process_markdown,
+    process_markdown_batch,
 )
 
 
@@ -221,5 +222,40 @@ Another paragraph with [doc](Files/doc.pdf).
         self.assertIn(("doc.pdf", "doc.pdf"), attachments)
 
 
+class TestProcessMarkdownBatch(unittest.TestCase):
+    """Tests for process_markdown_batch function."""
+
+    def test_batch_matches_sequential_calls(self):
+        """Batch results equal per-document process_markdown calls, in order."""
+        docs = [
+            "![img](Files/a.png)",
+            "No attachments here.",
+            "![img](Files/b%20c.png) and [doc](Files/d.pdf)",
+        ]
+
+        expected = [process_markdown(doc, "_attachments") for doc in docs]
+        results = process_markdown_batch(docs, "_attachments", workers=2)
+
+        self.assertEqual(results, expected)
+
+
+class TestPathologicalInputs(unittest.TestCase):
+    """Guard against regex backtracking blowups on adversarial notes."""
+
+    def test_repeated_open_brackets(self):
+        """Thousands of unclosed brackets must not trigger backtracking."""
+        import time
+
+        for content in ("[" * 10_000, "[[" * 10_000, "![](" * 10_000):
+            start = time.perf_counter()
+            rewritten, attachments = process_markdown(
+                content + "Files/x.png", "_attachments"
+            )
+            elapsed = time.perf_counter() - start
+            self.assertLess(elapsed, 1.0)
+            self.assertEqual(attachments, [])
+            self.assertEqual(rewritten, content + "Files/x.png")
+
+
 if __name__ == "__main__":
     unittest.main()